@@ -1,18 +1,28 @@
 import os
+import gzip
 import json
 import time
+import base64
+import asyncio
+import hashlib
 import tempfile
-from datetime import datetime, date
-from typing import List, Dict, Any, Tuple, Set
-
-import requests
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date, timezone
+from typing import List, Dict, Any, Tuple, Set, Optional
+
+import aiohttp
+import orjson
+import numpy as np
+from jinja2 import Environment, FileSystemLoader
 import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
 # --- Configuration ---
 DATA_FILE = "vebtc_data.json"
+IDS_FILE = "vebtc_ids.txt"
 CONTRACT_ADDRESS = "0x3D4b1b884A7a1E59fE8589a3296EC8f8cBB6f279"
+_CONTRACT_ADDRESS_LOWER = CONTRACT_ADDRESS.lower()
 LOCK_URL = f"https://api.explorer.mezo.org/api/v2/addresses/{CONTRACT_ADDRESS}/token-transfers"
 LOCK_TOKEN = "0x7b7C000000000000000000000000000000000000"
 VOTE_URL = "https://api.explorer.mezo.org/api/v2/addresses/0x48233cCC97B87Ba93bCA212cbEe48e3210211f03/logs"
@@ -23,14 +33,29 @@ VOTED_TOPIC_0 = "0x452d440efc30dfa14a0ef803ccb55936af860ec6a6960ed27f129bef913f2
 ADDRESS_DETAILS_URL = f"https://api.explorer.mezo.org/api/v2/addresses/{CONTRACT_ADDRESS}"
 VEBTC_LOGS_URL = f"https://api.explorer.mezo.org/api/v2/addresses/{CONTRACT_ADDRESS}/logs"
 DEFAULT_DECIMALS = 18
+FETCH_CONCURRENCY = 8
+BALANCE_CACHE_FILE = ".vebtc_balance.cache"
+BALANCE_CACHE_TTL = 30  # seconds
+DATA_JS_FILE = "dashboard_data.js"
+TEMPLATE_FILE = "dashboard.j2"
+PARSE_CACHE_DIR = ".vebtc_parse_cache"
+
+REQUEST_TIMEOUT = (3, 10)  # (connect, read) seconds
+RETRY_TOTAL = 3            # retries per request on transient failures
+RETRY_BACKOFF = 0.3        # base backoff seconds, doubled per retry
+RETRY_STATUSES = {429, 502, 503, 504}
+
+# Lock size buckets: left-closed intervals, so e.g. 0.001 falls in "0.001 - 0.01"
+CAT_BINS = [-np.inf, 0.001, 0.01, 0.1, 1, np.inf]
+CAT_LABELS = ["< 0.001", "0.001 - 0.01", "0.01 - 0.1", "0.1 - 1", "1 and above"]
 
 def load_data() -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
     """Loads existing data from JSON file."""
     if os.path.exists(DATA_FILE):
         print(f"Loading existing data from {DATA_FILE}...")
         try:
-            with open(DATA_FILE, "r") as f:
-                data = json.load(f)
+            with open(DATA_FILE, "rb") as f:
+                data = orjson.loads(f.read())
                 return data.get("locks", []), data.get("votes", [])
         except Exception as e:
             print(f"Error loading file: {e}. Starting fresh.")
@@ -39,16 +64,54 @@ def load_data() -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
 def save_data(locks: List[Dict[str, Any]], votes: List[Dict[str, Any]]) -> None:
     """Saves combined data to JSON file atomically."""
     print(f"Saving {len(locks)} locks and {len(votes)} votes to {DATA_FILE}...")
+    # Compact output by default; set DEBUG=1 for a human-readable file
+    option = orjson.OPT_INDENT_2 if os.environ.get("DEBUG") else 0
     # Atomic write: write to temp file then rename
     try:
-        with tempfile.NamedTemporaryFile("w", delete=False, dir=os.path.dirname(os.path.abspath(DATA_FILE)) or ".") as f:
-            json.dump({"locks": locks, "votes": votes}, f, indent=2)
+        with tempfile.NamedTemporaryFile("wb", delete=False, dir=os.path.dirname(os.path.abspath(DATA_FILE)) or ".") as f:
+            f.write(orjson.dumps({"locks": locks, "votes": votes}, option=option))
             temp_name = f.name
         os.replace(temp_name, DATA_FILE)
     except Exception as e:
         print(f"Error saving data: {e}")
         if 'temp_name' in locals() and os.path.exists(temp_name):
             os.remove(temp_name)
+        return
+    _write_uid_index(locks, votes)
+
+def _write_uid_index(locks: List[Dict[str, Any]], votes: List[Dict[str, Any]]) -> None:
+    """Rewrites the uid index (one uid per line) alongside the data file."""
+    lock_uid = _uid_builder("locks")
+    vote_uid = _uid_builder("votes")
+    try:
+        with tempfile.NamedTemporaryFile("w", delete=False, dir=os.path.dirname(os.path.abspath(IDS_FILE)) or ".") as f:
+            f.writelines(f"{lock_uid(i)}\n" for i in locks)
+            f.writelines(f"{vote_uid(i)}\n" for i in votes)
+            temp_name = f.name
+        os.replace(temp_name, IDS_FILE)
+    except Exception as e:
+        print(f"Error writing uid index: {e}")
+        if 'temp_name' in locals() and os.path.exists(temp_name):
+            os.remove(temp_name)
+
+def load_uid_index(expected_count: int):
+    """Loads the persisted uid index, or None if missing or out of sync.
+
+    uids are globally unique (tx_hash + log index), so locks and votes
+    share one index and one combined set works for both fetches.
+    """
+    try:
+        if not os.path.exists(IDS_FILE):
+            return None
+        with open(IDS_FILE, "r") as f:
+            ids = frozenset(f.read().splitlines())
+        if len(ids) != expected_count:
+            print("uid index out of sync with data file. Rebuilding.")
+            return None
+        return ids
+    except Exception as e:
+        print(f"Error loading uid index: {e}. Rebuilding.")
+        return None
 
 def get_unique_id(item: Dict[str, Any]) -> str:
     """Generates a unique ID for deduplication."""
@@ -58,200 +121,383 @@ def get_unique_id(item: Dict[str, Any]) -> str:
     idx = str(item.get("index", item.get("log_index", "0")))
     return f"{uid}_{idx}"
 
-def fetch_incremental(url: str, params: Dict[str, Any], existing_items: List[Dict[str, Any]], type_label: str = "items") -> List[Dict[str, Any]]:
-    """Fetches only NEW items until a known item is found."""
-    existing_ids: Set[str] = set([get_unique_id(i) for i in existing_items])
+def _uid_builder(type_label: str):
+    """Returns an item -> uid key function specialized per fetch type.
+
+    Lock transfers always carry tx_hash + log_index and contract logs always
+    carry transaction_hash + index, so the specialized builders skip
+    get_unique_id's fallback chain (three dict lookups per item). Unknown
+    labels keep the generic path.
+    """
+    if type_label == "locks":
+        def _uid(item: Dict[str, Any], _get=dict.get) -> str:
+            return f"{_get(item, 'tx_hash')}_{_get(item, 'log_index', '0')}"
+        return _uid
+    if type_label == "votes":
+        def _uid(item: Dict[str, Any], _get=dict.get) -> str:
+            return f"{_get(item, 'transaction_hash')}_{_get(item, 'index', '0')}"
+        return _uid
+    return get_unique_id
+
+def _make_client_session() -> aiohttp.ClientSession:
+    """Pooled keep-alive session so concurrent fetches share TCP+TLS handshakes."""
+    connector = aiohttp.TCPConnector(limit=FETCH_CONCURRENCY)
+    timeout = aiohttp.ClientTimeout(sock_connect=REQUEST_TIMEOUT[0], total=sum(REQUEST_TIMEOUT))
+    return aiohttp.ClientSession(connector=connector, timeout=timeout)
+
+async def _get_json(session: aiohttp.ClientSession, url: str, params: Optional[Dict[str, str]] = None) -> Any:
+    """GET with retry/backoff so transient explorer hiccups don't abort a run.
+
+    Connection errors, timeouts and 429/502/503/504 responses are retried up
+    to RETRY_TOTAL times with exponential backoff (0.3s, 0.6s, 1.2s, ...);
+    anything else raises immediately.
+    """
+    for attempt in range(RETRY_TOTAL + 1):
+        try:
+            async with session.get(url, params=params) as response:
+                response.raise_for_status()
+                return await response.json()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            status = getattr(e, "status", None)
+            if attempt >= RETRY_TOTAL or (status is not None and status not in RETRY_STATUSES):
+                raise
+            await asyncio.sleep(RETRY_BACKOFF * (2 ** attempt))
+
+async def fetch_incremental(url: str, params: Dict[str, Any], existing_items: List[Dict[str, Any]], type_label: str = "items", existing_ids=None, session: Optional[aiohttp.ClientSession] = None) -> List[Dict[str, Any]]:
+    """Fetches only NEW items until a known item is found.
+
+    The explorer API is cursor-paginated (next_page_params), so page K+1 can only
+    be requested once page K has answered. We still pipeline: as soon as a page
+    lands we fire the request for the next cursor BEFORE decoding the current
+    items, so network and processing overlap instead of alternating.
+
+    Pass existing_ids (e.g. from load_uid_index) to skip rebuilding the
+    dedup set from existing_items. Pass session to share connections with
+    other concurrent fetches; one is created (and closed) otherwise.
+    """
+    if session is None:
+        async with _make_client_session() as owned:
+            return await fetch_incremental(url, params, existing_items, type_label, existing_ids, owned)
+
+    uid_of = _uid_builder(type_label)
+    if existing_ids is None:
+        existing_ids = frozenset(uid_of(i) for i in existing_items)
+    seen: Set[str] = set()
     new_items: List[Dict[str, Any]] = []
-    
+
     print(f"Fetching new {type_label}...")
-    
-    while True:
+
+    async def fetch_page(page_params: Dict[str, Any]) -> Dict[str, Any]:
+        # aiohttp wants string query values; next_page_params mixes in ints
+        query = {k: str(v) for k, v in page_params.items() if v is not None}
+        return await _get_json(session, url, query)
+
+    next_task: Optional[asyncio.Task] = asyncio.create_task(fetch_page(dict(params)))
+
+    while next_task is not None:
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = await next_task
+            next_task = None
             items = data.get("items", [])
-            
-            if not items: 
+
+            if not items:
                 break
-            
+
+            # Speculatively prefetch the next page while we process this one
+            if data.get("next_page_params"):
+                params.update(data.get("next_page_params"))
+                next_task = asyncio.create_task(fetch_page(dict(params)))
+
             page_new_count = 0
             stop_fetching = False
-            
+
             for item in items:
-                uid = get_unique_id(item)
-                
+                uid = uid_of(item)
+
                 if uid in existing_ids:
                     # We hit an item we already have.
                     # Since APIs return newest first, we can stop fetching history.
                     stop_fetching = True
                     continue
-                
-                # Double check we haven't already added it in this session
-                if uid not in existing_ids: 
+
+                # The existing_ids branch above continues, so only the
+                # in-session dedup check remains here
+                if uid not in seen:
                     new_items.append(item)
-                    existing_ids.add(uid) # Add to set to prevent dups in same run
+                    seen.add(uid) # Add to set to prevent dups in same run
                     page_new_count += 1
-            
+
             print(f"  Fetched page... ({page_new_count} new)")
-            
+
             if stop_fetching:
                 print("  Caught up to existing data. Stopping fetch.")
                 break
-            
-            if data.get("next_page_params"):
-                params.update(data.get("next_page_params"))
-                time.sleep(0.1)
-            else:
-                break
-                
+
         except Exception as e:
             print(f"Error fetching: {e}")
             break
-            
+
+    # Caught up (or errored) with a speculative request still in flight
+    if next_task is not None:
+        next_task.cancel()
+
     return new_items
 
-def fetch_current_balance() -> str:
-    """Fetches the current coin balance of the veBTC contract."""
+_balance_cache: Optional[Tuple[float, str]] = None
+
+async def fetch_current_balance(session: Optional[aiohttp.ClientSession] = None) -> str:
+    """Fetches the current coin balance of the veBTC contract.
+
+    The dashboard auto-refreshes every 60s, so the result is cached for
+    BALANCE_CACHE_TTL seconds — in memory for this process and in a small
+    sidecar file so back-to-back script runs skip the round-trip too.
+    """
+    global _balance_cache
+
+    if _balance_cache and time.monotonic() - _balance_cache[0] < BALANCE_CACHE_TTL:
+        return _balance_cache[1]
+
+    # Cross-process cache: separate runs within the TTL share the sidecar file
+    try:
+        with open(BALANCE_CACHE_FILE, "r") as f:
+            cached_at, cached_balance = json.load(f)
+        if time.time() - cached_at < BALANCE_CACHE_TTL:
+            _balance_cache = (time.monotonic(), cached_balance)
+            return cached_balance
+    except Exception:
+        pass
+
+    if session is None:
+        async with _make_client_session() as owned:
+            return await fetch_current_balance(owned)
+
     print("Fetching current balance...")
     try:
-        response = requests.get(ADDRESS_DETAILS_URL)
-        response.raise_for_status()
-        data = response.json()
+        data = await _get_json(session, ADDRESS_DETAILS_URL)
         raw_balance = data.get("coin_balance", "0")
         # remove 18 digits, 2 decimals
         balance_val = float(raw_balance) / (10 ** DEFAULT_DECIMALS)
-        return f"{balance_val:,.2f}"
+        formatted = f"{balance_val:,.2f}"
+        _balance_cache = (time.monotonic(), formatted)
+        try:
+            with open(BALANCE_CACHE_FILE, "w") as f:
+                json.dump([time.time(), formatted], f)
+        except Exception:
+            pass
+        return formatted
     except Exception as e:
         print(f"Error fetching balance: {e}")
         return "N/A"
 
-def parse_data(locks: List[Dict[str, Any]], votes: List[Dict[str, Any]]) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
-    """Parses and merges both datasets."""
-    
-    # --- 1. Process Locks ---
-    lock_list = []
-    
+def _parse_locks(locks: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Parses lock transfers into a DataFrame in one vectorized pass."""
     print(f"Processing {len(locks)} lock records...")
-    
-    for tx in locks:
-        try:
-            ts = tx.get("timestamp")
-            if not ts: continue
-            dt = datetime.strptime(ts.split('.')[0].replace('Z', ''), "%Y-%m-%dT%H:%M:%S")
-            
-            raw_val = tx.get("total")
-            if isinstance(raw_val, dict): raw_val = raw_val.get("value")
-            amount = float(raw_val or 0) / (10 ** DEFAULT_DECIMALS)
-            
-            from_obj = tx.get("from", {})
-            sender = from_obj.get("hash", str(from_obj)) if isinstance(from_obj, dict) else str(from_obj)
-
-            # Filter out self-transfers (Contract -> Contract)
-            if sender.lower() == CONTRACT_ADDRESS.lower():
-                continue
-
-            if amount < 0.001: cat, order = "< 0.001", 1
-            elif amount < 0.01: cat, order = "0.001 - 0.01", 2
-            elif amount < 0.1: cat, order = "0.01 - 0.1", 3
-            elif amount < 1: cat, order = "0.1 - 1", 4
-            else: cat, order = "1 and above", 5
-
-            lock_list.append({
-                "date": dt.date(),
-                "ts": dt,
-                "amount": amount,
-                "type": "lock",
-                "sender": sender,
-                "cat": cat,
-                "order": order
-            })
-        except Exception as e:
-            # Optionally log verbose errors
-            continue
-
-    # --- 2. Process Votes ---
-    vote_list = []
+    if not locks:
+        return pd.DataFrame()
+
+    df = pd.json_normalize(locks)
+
+    raw_val = df["total.value"] if "total.value" in df.columns else df.get("total")
+    if raw_val is None:
+        raw_val = pd.Series(np.nan, index=df.index)
+    sender = df["from.hash"] if "from.hash" in df.columns else df.get("from", pd.Series("", index=df.index)).astype(str)
+
+    out = pd.DataFrame({
+        "ts": pd.to_datetime(df.get("timestamp"), errors="coerce", utc=True).dt.tz_localize(None),
+        "amount": pd.to_numeric(raw_val, errors="coerce").fillna(0) / (10 ** DEFAULT_DECIMALS),
+        "sender": sender.fillna(""),
+    })
+    out = out[out["ts"].notna()]
+
+    # Filter out self-transfers (Contract -> Contract)
+    out = out[out["sender"].str.lower() != _CONTRACT_ADDRESS_LOWER]
+
+    out["date"] = out["ts"].dt.date
+    cat = pd.cut(out["amount"], bins=CAT_BINS, labels=CAT_LABELS, right=False)
+    out["cat"] = cat.astype(str)
+    out["order"] = cat.cat.codes + 1
+    out["type"] = "lock"
+    return out[["date", "ts", "amount", "type", "sender", "cat", "order"]].reset_index(drop=True)
+
+def _parse_iso(ts: str) -> datetime:
+    """Parses an explorer timestamp ("2026-01-04T13:42:10.000000Z") to a naive
+    datetime by direct slicing — strptime's locale-aware format machinery is
+    roughly 10x slower for this fixed layout."""
+    return datetime(int(ts[0:4]), int(ts[5:7]), int(ts[8:10]),
+                    int(ts[11:13]), int(ts[14:16]), int(ts[17:19]))
+
+def _decode_raw_vote(log: Dict[str, Any]) -> Optional[Tuple[datetime, float, float, str, str]]:
+    """Hex fallback for Voted logs the explorer did not decode.
+
+    Returns (ts, voting_power, total_weight, voter, pool) or None.
+    """
+    topics = log.get("topics", [])
+    data_hex = log.get("data", "").replace("0x", "")
+    if len(data_hex) < 192:
+        return None
+
+    # int.from_bytes(bytes.fromhex(...)) decodes a 32-byte word several times
+    # faster than int(str, 16) — both steps are single C calls
+    weight_val = float(int.from_bytes(bytes.fromhex(data_hex[0:64]), "big"))
+    total_weight_val = float(int.from_bytes(bytes.fromhex(data_hex[64:128]), "big"))
+    event_ts = int.from_bytes(bytes.fromhex(data_hex[128:192]), "big")
+    voter_addr = "0x" + topics[1][26:] if len(topics) > 1 else "Unknown"
+    pool_addr = "0x" + topics[2][26:] if len(topics) > 2 else "Unknown"
+
+    if event_ts > 0:
+        # Naive UTC, matching the decoded path's pd.to_datetime(unit="s") and
+        # the lock timestamps — a bare fromtimestamp would use the runner's
+        # local TZ and shift these votes into different day buckets
+        dt = datetime.fromtimestamp(event_ts, tz=timezone.utc).replace(tzinfo=None)
+    else:
+        ts_str = log.get("timestamp") or log.get("block_timestamp")
+        if not ts_str:
+            return None
+        dt = _parse_iso(ts_str)
+
+    if weight_val <= 0:
+        return None
+    return (dt,
+            weight_val / (10 ** DEFAULT_DECIMALS),
+            total_weight_val / (10 ** DEFAULT_DECIMALS),
+            voter_addr,
+            pool_addr)
+
+def _parse_votes(votes: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Parses Voted event logs into a DataFrame.
+
+    Decoded logs (the normal case) are handled in bulk: explode the
+    parameter lists with json_normalize, pivot name -> value per log, then
+    scale/convert whole columns at once. Undecoded logs fall back to the
+    per-row hex decoder.
+    """
     print(f"Processing {len(votes)} logs for Votes...")
 
+    # One partition pass; type(x) is dict is a single C comparison vs
+    # isinstance's subclass walk, and we only look up "decoded" once per log
+    decoded_logs: List[Dict[str, Any]] = []
+    raw_logs: List[Dict[str, Any]] = []
     for log in votes:
-        try:
-            # 1. Filter by Topic 0
-            topics = log.get("topics", [])
-            if not topics or topics[0] != VOTED_TOPIC_0:
+        topics = log.get("topics")
+        if not topics or topics[0] != VOTED_TOPIC_0:
+            continue
+        if type(log.get("decoded")) is dict:
+            decoded_logs.append(log)
+        else:
+            raw_logs.append(log)
+
+    frames = []
+    if decoded_logs:
+        params = pd.json_normalize(decoded_logs, record_path=["decoded", "parameters"], meta=["transaction_hash", "index"])
+        params["_uid"] = params["transaction_hash"].astype(str) + "_" + params["index"].astype(str)
+        wide = params.pivot_table(index="_uid", columns="name", values="value", aggfunc="first")
+        wide = wide.reindex(pd.unique(params["_uid"]))  # keep input (newest-first) order
+
+        weight = pd.to_numeric(wide.get("weight"), errors="coerce")
+        df = pd.DataFrame({
+            "ts": pd.to_datetime(pd.to_numeric(wide.get("timestamp"), errors="coerce"), unit="s", errors="coerce"),
+            "voting_power": weight / (10 ** DEFAULT_DECIMALS),
+            "total_weight": pd.to_numeric(wide.get("totalWeight"), errors="coerce").fillna(0) / (10 ** DEFAULT_DECIMALS),
+            "voter": wide.get("voter", pd.Series(dtype=object)).fillna("Unknown"),
+            "pool": wide.get("pool", pd.Series(dtype=object)).fillna("Unknown"),
+        }).reset_index(drop=True)
+        frames.append(df[(df["voting_power"] > 0) & df["ts"].notna()])
+
+    if raw_logs:
+        # Parallel column lists (SoA) rather than a dict per event: pandas
+        # builds a frame from arrays far cheaper than from a list of dicts
+        ts_list: List[datetime] = []
+        power_list: List[float] = []
+        tw_list: List[float] = []
+        voter_list: List[str] = []
+        pool_list: List[str] = []
+        for log in raw_logs:
+            try:
+                row = _decode_raw_vote(log)
+            except Exception:
                 continue
-            
-            # 2. Extract Data
-            weight_val = 0.0
-            total_weight_val = 0.0
-            voter_addr = "Unknown"
-            pool_addr = "Unknown"
-            event_ts = None
-            found_weight = False
-
-            decoded = log.get("decoded")
-            
-            # METHOD A: Decoded
-            if decoded and isinstance(decoded, dict):
-                params = decoded.get("parameters", [])
-                for p in params:
-                    name = p.get("name", "")
-                    val = p.get("value")
-                    if name == "weight":
-                        weight_val = float(val)
-                        found_weight = True
-                    elif name == "totalWeight":
-                        total_weight_val = float(val)
-                    elif name == "voter":
-                        voter_addr = str(val)
-                    elif name == "pool":
-                        pool_addr = str(val)
-                    elif name == "timestamp":
-                        event_ts = int(val)
-
-            # METHOD B: Hex Backup
-            if not found_weight:
-                data_hex = log.get("data", "").replace("0x", "")
-                if len(data_hex) >= 192:
-                    weight_val = float(int(data_hex[0:64], 16))
-                    total_weight_val = float(int(data_hex[64:128], 16))
-                    event_ts = int(data_hex[128:192], 16)
-                    if len(topics) > 1: voter_addr = "0x" + topics[1][26:]
-                    if len(topics) > 2: pool_addr = "0x" + topics[2][26:]
-                    found_weight = True
-
-            # 3. Timestamp
-            if event_ts and event_ts > 0:
-                dt = datetime.fromtimestamp(event_ts)
-            else:
-                ts_str = log.get("timestamp") or log.get("block_timestamp")
-                if ts_str:
-                    dt = datetime.strptime(ts_str.split('.')[0].replace('Z', ''), "%Y-%m-%dT%H:%M:%S")
-                else:
-                    continue
+            if row is None:
+                continue
+            ts_list.append(row[0])
+            power_list.append(row[1])
+            tw_list.append(row[2])
+            voter_list.append(row[3])
+            pool_list.append(row[4])
+        if ts_list:
+            frames.append(pd.DataFrame({
+                "ts": ts_list,
+                "voting_power": power_list,
+                "total_weight": tw_list,
+                "voter": voter_list,
+                "pool": pool_list,
+            }))
+
+    if not frames:
+        return pd.DataFrame()
+
+    df_votes = pd.concat(frames, ignore_index=True)
+    df_votes["date"] = df_votes["ts"].dt.date
+    df_votes["type"] = "vote"
+    return df_votes[["date", "ts", "voting_power", "total_weight", "voter", "pool", "type"]]
+
+_PARSE_FRAME_NAMES = ("main", "dist", "raw_locks", "raw_votes")
+
+def _parse_cache_key(locks: List[Dict[str, Any]], votes: List[Dict[str, Any]]) -> str:
+    """Content fingerprint of the inputs: lengths plus the boundary records.
+
+    New items are prepended and old ones never change, so (count, first,
+    last) of each list pins down the dataset without hashing all of it.
+    """
+    fingerprint = [
+        len(locks), len(votes),
+        locks[0] if locks else {}, locks[-1] if locks else {},
+        votes[0] if votes else {}, votes[-1] if votes else {},
+    ]
+    return hashlib.blake2b(orjson.dumps(fingerprint), digest_size=16).hexdigest()
+
+def _load_parsed_cache(key: str) -> Optional[Tuple[pd.DataFrame, ...]]:
+    try:
+        paths = [os.path.join(PARSE_CACHE_DIR, f"parsed_{key}_{name}.parquet") for name in _PARSE_FRAME_NAMES]
+        if not all(os.path.exists(p) for p in paths):
+            return None
+        return tuple(pd.read_parquet(p) for p in paths)
+    except Exception as e:
+        print(f"Parse cache read failed: {e}. Re-parsing.")
+        return None
 
-            # 4. Save
-            if found_weight and weight_val > 0:
-                vote_list.append({
-                    "date": dt.date(),
-                    "ts": dt,
-                    "voting_power": weight_val / (10 ** DEFAULT_DECIMALS),
-                    "total_weight": total_weight_val / (10 ** DEFAULT_DECIMALS),
-                    "voter": voter_addr,
-                    "pool": pool_addr,
-                    "type": "vote"
-                })
-
-        except Exception as e: 
-            continue
+def _store_parsed_cache(key: str, frames: Tuple[pd.DataFrame, ...]) -> None:
+    try:
+        os.makedirs(PARSE_CACHE_DIR, exist_ok=True)
+        # Only the current key is ever read back; drop stale entries
+        for name in os.listdir(PARSE_CACHE_DIR):
+            if name.startswith("parsed_") and key not in name:
+                os.remove(os.path.join(PARSE_CACHE_DIR, name))
+        for name, df in zip(_PARSE_FRAME_NAMES, frames):
+            df.to_parquet(os.path.join(PARSE_CACHE_DIR, f"parsed_{key}_{name}.parquet"))
+    except Exception as e:
+        print(f"Parse cache write failed: {e}")
 
-    print(f"Parsed {len(vote_list)} valid vote events.")
-    
-    # --- 3. DataFrames ---
-    df_locks = pd.DataFrame(lock_list)
-    df_votes = pd.DataFrame(vote_list)
-    
-    # --- 4. Aggregations ---
+def parse_data(locks: List[Dict[str, Any]], votes: List[Dict[str, Any]]) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Parses and merges both datasets.
+
+    Deterministic in its inputs, so results are memoized to parquet: when
+    the dashboard is regenerated without new data the whole parse phase is
+    skipped in favor of four pd.read_parquet calls.
+    """
+    cache_key = _parse_cache_key(locks, votes)
+    cached = _load_parsed_cache(cache_key)
+    if cached is not None:
+        print("Parse cache hit. Skipping re-parse.")
+        return cached
+
+    # --- 1. Process Locks ---
+    df_locks = _parse_locks(locks)
+
+    # --- 2. Process Votes ---
+    df_votes = _parse_votes(votes)
+    print(f"Parsed {len(df_votes)} valid vote events.")
+
+    # --- 3. Aggregations ---
     if not df_locks.empty:
         daily_locks = df_locks.groupby("date").agg({"amount": "sum", "type": "count"}).rename(columns={"type": "lock_count"}).reset_index()
     else:
@@ -262,702 +508,147 @@ def parse_data(locks: List[Dict[str, Any]], votes: List[Dict[str, Any]]) -> Tupl
     else:
         daily_votes = pd.DataFrame(columns=["date", "voting_power", "vote_count"])
 
-    # --- 5. Merge ---
-    # Union of all dates
-    all_dates = sorted(list(set(daily_locks["date"].tolist() + daily_votes["date"].tolist())))
-    df_main = pd.DataFrame({"date": all_dates})
-    
-    df_main = df_main.merge(daily_locks, on="date", how="left").fillna(0)
-    df_main = df_main.merge(daily_votes, on="date", how="left").fillna(0)
-    
+    # --- 4. Merge ---
+    # A sorted outer merge unions the dates in-engine; no Python-level
+    # set/sort over materialized lists
+    df_main = daily_locks.merge(daily_votes, on="date", how="outer", sort=True).fillna(0)
+
     df_main["cumulative_locks"] = df_main["amount"].cumsum()
     
     df_main["cumulative_votes"] = df_main["voting_power"].cumsum()
     
-    # --- 6. Distribution ---
+    # --- 5. Distribution ---
     if not df_locks.empty:
         dist_df = df_locks.groupby(["cat", "order"]).agg({"type": "count", "amount": "sum"}).rename(columns={"type": "tx_count"}).reset_index()
         dist_df.sort_values("order", inplace=True)
-        dist_df["legend"] = dist_df.apply(lambda r: f"{r['cat']} (Txs: {r['tx_count']}, Total: {r['amount']:.2f})", axis=1)
+        dist_df["legend"] = (dist_df["cat"].astype(str) + " (Txs: " + dist_df["tx_count"].astype(str)
+                             + ", Total: " + dist_df["amount"].map("{:.2f}".format) + ")")
     else:
         dist_df = pd.DataFrame()
 
-    # --- 7. Raw ---
+    # --- 6. Raw ---
     df_raw_locks = df_locks.sort_values("ts", ascending=False) if not df_locks.empty else pd.DataFrame()
     df_raw_votes = df_votes.sort_values("ts", ascending=False) if not df_votes.empty else pd.DataFrame()
 
-    return df_main, dist_df, df_raw_locks, df_raw_votes
+    frames = (df_main, dist_df, df_raw_locks, df_raw_votes)
+    _store_parsed_cache(cache_key, frames)
+    return frames
 
-def generate_dashboard(locks: List[Dict[str, Any]], votes: List[Dict[str, Any]], current_balance: str, total_voted: str, total_supply: str) -> None:
+def generate_dashboard(locks: Dict[str, List[Any]], votes: Dict[str, List[Any]], current_balance: str, total_voted: str, total_supply: str, daily_stats: List[Dict[str, Any]], daily_dist: Dict[str, List[Any]]) -> None:
     print("Generating Dashboard...")
-    
+
     def json_serial(obj):
         if isinstance(obj, (datetime, date)):
             return obj.isoformat()
         return str(obj)
 
-    # HTML Template
-    html_content = f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>veBTC Locks & Votes</title>
-    <meta http-equiv="refresh" content="60">
-    <script src="https://cdn.plot.ly/plotly-2.27.0.min.js"></script>
-    <style>
-        body {{ font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, Helvetica, Arial, sans-serif; margin: 0; padding: 20px; background: #f4f4f4; }}
-        .container {{ max-width: 1400px; margin: 0 auto; background: white; padding: 60px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        h1 {{ color: #333; margin-top: 0; margin-bottom: 10px; padding-top: 20px; }}
-        h2, h3 {{ color: #333; margin-top: 0; margin-bottom: 10px; }}
-        .header {{ display: flex; justify-content: space-between; align-items: start; border-bottom: 2px solid #eee; padding-bottom: 30px; margin-bottom: 50px; gap: 80px; }}
-        .header-left {{ display: flex; flex-direction: column; gap: 10px; }}
-        .controls {{ display: flex; gap: 15px; align-items: center; background: #f8f9fa; padding: 15px; border-radius: 6px; margin-bottom: 20px; border: 1px solid #ddd; flex-wrap: wrap; }}
-        .control-group {{ display: flex; flex-direction: column; gap: 5px; }}
-        .control-group label {{ font-size: 12px; font-weight: 600; color: #666; text-transform: uppercase; }}
-        input[type="date"] {{ padding: 8px; border: 1px solid #ccc; border-radius: 4px; font-size: 14px; }}
-        
-        /* Grid */
-        .grid-row {{ display: flex; gap: 20px; margin-bottom: 30px; }}
-        .col {{ flex: 1; min-width: 300px; }}
-        
-        .card {{ background: white; border: 1px solid #eee; border-radius: 6px; padding: 15px; height: 100%; box-sizing: border-box; }}
-        .card h3 {{ font-size: 16px; border-bottom: 1px solid #eee; padding-bottom: 10px; margin-bottom: 10px; display: flex; justify-content: space-between; align-items: center; }}
-        
-        /* Mobile Resp */
-        @media (max-width: 1024px) {{
-            .grid-row {{ flex-direction: column; }}
-            .header {{ flex-direction: column; gap: 20px; text-align: center; align-items: center; }}
-            .header-left {{ align-items: center; }}
-        }}
-
-        /* Table Styles */
-        table {{ width: 100%; border-collapse: collapse; font-size: 13px; }}
-        th, td {{ padding: 8px 12px; text-align: left; border-bottom: 1px solid #eee; }}
-        th {{ background: #f8f9fa; font-weight: 600; color: #444; white-space: nowrap; }}
-        tr:hover {{ background: #f5f5f5; cursor: pointer; }}
-        
-        /* Buttons */
-        .btn {{ padding: 6px 12px; border: 1px solid #ccc; background: white; border-radius: 4px; cursor: pointer; font-size: 12px; text-decoration: none; color: #333; display: inline-block; }}
-        .btn:hover {{ background: #f0f0f0; }}
-        
-        .legend-color {{ display: inline-block; width: 12px; height: 12px; border-radius: 2px; margin-right: 8px; vertical-align: middle; }}
-        .mono {{ font-family: "SF Mono", "Monaco", "Consolas", monospace; }}
-        
-        .summary-stats {{ display: flex; gap: 20px; margin-bottom: 20px; }}
-        .stat-box {{ background: #f8f9fa; padding: 15px; border-radius: 6px; flex: 1; text-align: center; border: 1px solid #ddd; }}
-        .stat-value {{ font-size: 24px; font-weight: 700; color: #2c3e50; }}
-        .stat-label {{ font-size: 12px; color: #7f8c8d; text-transform: uppercase; letter-spacing: 0.5px; margin-top: 5px; }}
-
-        /* Tabs */
-        .tabs {{ display: flex; border-bottom: 1px solid #ddd; margin-bottom: 20px; }}
-        .tab {{ padding: 10px 20px; cursor: pointer; border-bottom: 2px solid transparent; font-weight: 500; color: #666; }}
-        .tab.active {{ border-bottom: 2px solid #007bff; color: #007bff; }}
-        .tab-content {{ display: none; }}
-        .tab-content.active {{ display: block; }}
-        
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <div class="header-left">
-                <h1 style="margin-bottom: 0;">veBTC Locks & Votes</h1>
-                <div style="font-size: 14px; color: #666;">Last Updated: {datetime.now().strftime('%Y-%m-%d %H:%M')}</div>
-            </div>
-            <div class="stat-box" style="min-width: 150px;">
-                 <div class="stat-value">{current_balance} BTC</div>
-                 <div class="stat-label">Total Locked (On-Chain)</div>
-            </div>
-            <div class="stat-box" style="min-width: 180px;">
-                 <div class="stat-value">{total_voted} veBTC</div>
-                 <div class="stat-label">Total Voted (Gauges)</div>
-            </div>
-        </div>
-
-        <!-- Controls -->
-        <div class="controls">
-            <div class="control-group">
-                <label>Start Date</label>
-                <input type="date" id="startDate" onchange="updateDashboard()">
-            </div>
-            <div class="control-group">
-                <label>End Date</label>
-                <input type="date" id="endDate" onchange="updateDashboard()">
-            </div>
-             <div class="control-group" style="margin-left: auto;">
-                <button onclick="resetDates()" style="padding: 8px 16px; background: #fff; border: 1px solid #ccc; cursor: pointer; border-radius: 4px;">Reset Range</button>
-            </div>
-        </div>
-
-        <!-- Summary Stats (Filtered) -->
-        <div class="summary-stats">
-            <div class="stat-box">
-                <div class="stat-value" id="disp-locked">0.00</div>
-                <div class="stat-label">Locked in Range (BTC)</div>
-            </div>
-            <div class="stat-box">
-                <div class="stat-value" id="disp-txs">0</div>
-                <div class="stat-label">Lock Transactions</div>
-            </div>
-            <div class="stat-box">
-                <div class="stat-value" id="disp-votes">0.00</div>
-                <div class="stat-label">Voting Power (veBTC)</div>
-            </div>
-             <div class="stat-box">
-                <div class="stat-value" id="disp-voters">0</div>
-                <div class="stat-label">Vote Events</div>
-            </div>
-        </div>
-
-        <!-- Main Chart -->
-        <div class="card" style="margin-bottom: 20px;">
-            <div id="mainChart" style="height: 500px;"></div>
-        </div>
-        
-        <!-- Count Chart -->
-         <div class="card" style="margin-bottom: 30px;">
-            <div id="countChart" style="height: 300px;"></div>
-        </div>
-
-        <!-- Distribution & Config -->
-        <div class="grid-row">
-            <!-- Pie Chart Vol -->
-            <div class="col card">
-                <h3>Volume Distribution</h3>
-                <div id="pieChart" style="height: 300px;"></div>
-            </div>
-            <!-- Pie Chart Count -->
-             <div class="col card">
-                <h3>Count Distribution</h3>
-                <div id="pieChartCount" style="height: 300px;"></div>
-            </div>
-            
-            <!-- Interact Table -->
-            <div class="col card">
-                <h3>Summary</h3>
-                <table id="distTable">
-                    <thead>
-                        <tr>
-                            <th>Range</th>
-                            <th>Txs</th>
-                            <th>Vol (BTC)</th>
-                        </tr>
-                    </thead>
-                    <tbody></tbody>
-                </table>
-            </div>
-        </div>
-        
-        <!-- Tabbed Data View -->
-         <div class="card">
-            <div class="tabs">
-                <div class="tab active" onclick="switchTab('locks')">Lock Data (<span id="tcount-locks">0</span>)</div>
-                <div class="tab" onclick="switchTab('votes')">Vote Data (<span id="tcount-votes">0</span>)</div>
-            </div>
-            
-            <div id="tab-locks" class="tab-content active">
-                 <div style="margin-bottom: 10px;">
-                    <button class="btn" onclick="downloadCSV('locks')">Download CSV</button>
-                 </div>
-                 <div style="overflow-x: auto;">
-                    <table id="lockTable">
-                        <thead><tr><th>Time</th><th>Sender</th><th>Amount (BTC)</th><th>Type</th></tr></thead>
-                        <tbody></tbody>
-                    </table>
-                 </div>
-            </div>
-             <div id="tab-votes" class="tab-content">
-                 <div style="margin-bottom: 10px;">
-                    <button class="btn" onclick="downloadCSV('votes')">Download CSV</button>
-                 </div>
-                 <div style="overflow-x: auto;">
-                    <table id="voteTable">
-                        <thead><tr><th>Time</th><th>Voter</th><th>Weight (veBTC)</th><th>Global Total</th></tr></thead>
-                        <tbody></tbody>
-                    </table>
-                 </div>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        // --- Raw Data ---
-        const rawLocks = {json.dumps(locks, default=json_serial)};
-        const rawVotes = {json.dumps(votes, default=json_serial)};
-
-        // --- Config ---
-        const colors = {{
-            "< 0.001": "#e3f2fd", 
-            "0.001 - 0.01": "#90caf9", 
-            "0.01 - 0.1": "#42a5f5", 
-            "0.1 - 1": "#1e88e5", 
-            "1 and above": "#1565c0"
-        }};
-        
-        const catOrder = ["< 0.001", "0.001 - 0.01", "0.01 - 0.1", "0.1 - 1", "1 and above"];
-
-        // --- State ---
-        let hiddenCategories = new Set(); // For Pie Toggle
-
-        // --- Init ---
-        window.onload = function() {{
-            try {{
-                // Set default dates
-                const defaultStart = "2025-12-18";
-                
-                // Find max date in data
-                let maxDate = "2026-01-01";
-                
-                // Sort raw data using UTC helper
-                rawLocks.sort((a, b) => parseDateUTC(a.date) - parseDateUTC(b.date));
-                rawVotes.sort((a, b) => parseDateUTC(a.date) - parseDateUTC(b.date));
-                
-                if (rawLocks.length > 0) maxDate = rawLocks[rawLocks.length-1].date;
-                
-                document.getElementById("startDate").value = defaultStart;
-                document.getElementById("endDate").value = maxDate;
-                
-                console.log("Init complete. rawLocks:", rawLocks.length, "rawVotes:", rawVotes.length);
-                
-                updateDashboard();
-                
-                // Resize Handler
-                window.onresize = function() {{
-                    Plotly.Plots.resize('mainChart');
-                    Plotly.Plots.resize('countChart');
-                    Plotly.Plots.resize('pieChart');
-                    Plotly.Plots.resize('pieChartCount');
-                }};
-            }} catch (e) {{
-                console.error("Dashboard Init Error:", e);
-                alert("Error initializing dashboard: " + e.message);
-            }}
-        }};
-
-        function resetDates() {{
-             document.getElementById("startDate").value = "2025-12-18";
-             if (rawLocks.length > 0) {{
-                document.getElementById("endDate").value = rawLocks[rawLocks.length-1].date;
-             }}
-             updateDashboard();
-        }}
-        
-        // --- CSV Download ---
-        function downloadCSV(type) {{
-             const startStr = document.getElementById("startDate").value;
-             const endStr = document.getElementById("endDate").value;
-             const startTs = new Date(startStr).getTime();
-             const endTs = new Date(endStr).getTime() + 86400000;
-             
-             let data, filename, headers, rowMapper;
-             
-             if(type === 'locks') {{
-                 data = rawLocks.filter(l => {{ const d = parseDateUTC(l.date); return d >= startTs && d < endTs; }});
-                 filename = `vebtc_locks_${{startStr}}_${{endStr}}.csv`;
-                 headers = ["Date", "Timestamp", "Sender", "Amount", "Category"];
-                 rowMapper = l => [l.date, l.ts, l.sender, l.amount, l.cat];
-             }} else {{
-                 data = rawVotes.filter(l => {{ const d = parseDateUTC(l.date); return d >= startTs && d < endTs; }});
-                 filename = `vebtc_votes_${{startStr}}_${{endStr}}.csv`;
-                 headers = ["Date", "Timestamp", "Voter", "VoteWeight", "TotalWeight"];
-                 rowMapper = v => [v.date, v.ts, v.voter, v.voting_power, v.total_weight];
-             }}
-             
-             let csvContent = "data:text/csv;charset=utf-8," + headers.join(",") + "\\n";
-             data.forEach(item => {{
-                 const row = rowMapper(item).map(val => `"${{val}}"`).join(",");
-                 csvContent += row + "\\n";
-             }});
-             
-             const encodedUri = encodeURI(csvContent);
-             const link = document.createElement("a");
-             link.setAttribute("href", encodedUri);
-             link.setAttribute("download", filename);
-             document.body.appendChild(link);
-             link.click();
-             document.body.removeChild(link);
-        }}
-        
-        function switchTab(tab) {{
-            document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
-            document.querySelectorAll('.tab-content').forEach(c => c.classList.remove('active'));
-            
-            if (tab === 'locks') {{
-                document.querySelectorAll('.tab')[0].classList.add('active');
-                document.getElementById('tab-locks').classList.add('active');
-            }} else {{
-                document.querySelectorAll('.tab')[1].classList.add('active');
-                document.getElementById('tab-votes').classList.add('active');
-            }}
-        }}
-
-        // Helper to parse date as UTC timestamp to avoid timezone issues
-        function parseDateUTC(str) {{
-            if (!str) return 0;
-            const parts = str.split('-');
-            // year, monthIndex (0-11), day
-            return Date.UTC(parseInt(parts[0]), parseInt(parts[1]) - 1, parseInt(parts[2]));
-        }}
-
-        // --- Core Logic ---
-        function updateDashboard() {{
-            const startStr = document.getElementById("startDate").value;
-            const endStr = document.getElementById("endDate").value;
-            
-            console.log("Updating dashboard for range:", startStr, "to", endStr);
-            
-            const startTs = parseDateUTC(startStr);
-            const endTs = parseDateUTC(endStr) + 86400000; // End of day
-
-            // Filter
-            const filteredLocks = rawLocks.filter(l => {{
-                const d = parseDateUTC(l.date);
-                return d >= startTs && d < endTs;
-            }});
-            const filteredVotes = rawVotes.filter(l => {{
-                const d = parseDateUTC(l.date);
-                return d >= startTs && d < endTs;
-            }});
-            
-            console.log("Filtered Locks:", filteredLocks.length, "Filtered Votes:", filteredVotes.length);
-
-            // Calc Stats
-            const totalLocked = filteredLocks.reduce((acc, curr) => acc + curr.amount, 0);
-            const totalVoteWeight = filteredVotes.reduce((acc, curr) => acc + curr.voting_power, 0);
-            
-            // DOM Updates
-            document.getElementById("disp-locked").innerText = totalLocked.toLocaleString(undefined, {{minimumFractionDigits: 2, maximumFractionDigits: 2}});
-            document.getElementById("disp-txs").innerText = filteredLocks.length;
-            document.getElementById("disp-votes").innerText = totalVoteWeight.toLocaleString(undefined, {{minimumFractionDigits: 2, maximumFractionDigits: 2}});
-            document.getElementById("disp-voters").innerText = filteredVotes.length;
-            
-            document.getElementById("tcount-locks").innerText = filteredLocks.length;
-            document.getElementById("tcount-votes").innerText = filteredVotes.length;
-
-            renderMainChart(filteredLocks, filteredVotes);
-            renderCountChart(filteredLocks, filteredVotes);
-            renderDistribution(filteredLocks);
-            renderTables(filteredLocks, filteredVotes);
-        }}
-
-        function renderMainChart(locks, votes) {{
-            // Group by date
-            const dataMap = {{}};
-            
-            // Build map of all dates in range
-            locks.forEach(l => {{
-                if (!dataMap[l.date]) dataMap[l.date] = {{locked: 0, votes: 0, tx_lock: 0, tx_vote: 0}};
-                dataMap[l.date].locked += l.amount;
-                dataMap[l.date].tx_lock += 1;
-            }});
-            
-            votes.forEach(v => {{
-                if (!dataMap[v.date]) dataMap[v.date] = {{locked: 0, votes: 0, tx_lock: 0, tx_vote: 0}};
-                dataMap[v.date].votes += v.voting_power;
-                dataMap[v.date].tx_vote += 1;
-            }});
-
-            const dates = Object.keys(dataMap).sort();
-            const lockVals = [];
-            const voteVals = [];
-            
-            // Calc cumulatives (Local to filter window? Or Global?)
-            // User likely wants trend of CURRENT data.
-            // If we filter, cumulative should start from 0 at start? Or true cumulative?
-            // "True Cumulative" requires processing ALL data before filter.
-            // But let's simplify: Cumulative of the displayed data.
-            const cumLockVals = [];
-            const cumVoteVals = [];
-            let rLock = 0;
-            let rVote = 0;
-            
-            let totalLock = 0;
-            let totalVote = 0;
-            
-            dates.forEach(d => {{
-                const l = dataMap[d].locked;
-                const v = dataMap[d].votes;
-                rLock += l;
-                rVote += v;
-                totalLock += l;
-                totalVote += v;
-                
-                lockVals.push(l);
-                voteVals.push(v);
-                cumLockVals.push(rLock);
-                cumVoteVals.push(rVote);
-            }});
-
-            const trace1 = {{
-                x: dates, y: lockVals, name: 'Daily New Locks (BTC)', type: 'bar', 
-                marker: {{color: '#1565c0'}}, offsetgroup: 1,
-                text: lockVals.map(v => v > 0 ? v.toFixed(2) : ""), textposition: 'auto'
-            }};
-            
-            const trace2 = {{
-                x: dates, y: voteVals, name: 'Daily Votes Cast (veBTC)', type: 'bar', 
-                marker: {{color: '#28a745', opacity: 0.7}}, offsetgroup: 2,
-                text: voteVals.map(v => v > 0 ? v.toFixed(2) : ""), textposition: 'auto'
-            }};
-            
-            const trace3 = {{
-                x: dates, y: cumLockVals, name: 'Cumulative Locked', type: 'scatter', mode: 'lines',
-                line: {{color: '#ff9800', width: 3}}, yaxis: 'y2'
-            }};
-            
-            const trace4 = {{
-                x: dates, y: cumVoteVals, name: 'Cumulative Votes', type: 'scatter', mode: 'lines',
-                line: {{color: '#9400D3', width: 3, dash: 'dot'}}, yaxis: 'y2'
-            }};
-            
-            const layout = {{
-                title: {{
-                    text: 'BTC Locked & Voting Power',
-                    y: 0.98,
-                    yanchor: 'top'
-                }},
-                barmode: 'group',
-                margin: {{t: 120, l: 50, r: 50, b: 50}},
-                legend: {{orientation: 'h', y: 1.3}},
-                hovermode: 'x unified',
-                autosize: true,
-                xaxis: {{
-                    type: 'date',
-                    tickformat: '%b %d',
-                    automargin: true,
-                    showline: true,
-                    linewidth: 1,
-                    linecolor: '#888',
-                    ticks: 'outside'
-                }},
-                yaxis: {{
-                    title: 'Daily Amount',
-                    rangemode: 'tozero',
-                    zeroline: false,
-                    showline: true,
-                    linewidth: 1,
-                    linecolor: '#ddd'
-                }},
-                yaxis2: {{
-                    title: 'Cumulative Amount',
-                    overlaying: 'y',
-                    side: 'right',
-                    rangemode: 'tozero',
-                    zeroline: false,
-                    showgrid: false
-                }}
-            }};
-            
-            Plotly.newPlot('mainChart', [trace1, trace2, trace3, trace4], layout, {{responsive: true}});
-        }}
-        
-        function renderCountChart(locks, votes) {{
-            const dataMap = {{}};
-             locks.forEach(l => {{
-                if (!dataMap[l.date]) dataMap[l.date] = {{locked: 0, votes: 0}};
-                dataMap[l.date].locked += 1;
-            }});
-            votes.forEach(v => {{
-                if (!dataMap[v.date]) dataMap[v.date] = {{locked: 0, votes: 0}};
-                dataMap[v.date].votes += 1;
-            }});
-            
-            const dates = Object.keys(dataMap).sort();
-            const lockCounts = dates.map(d => dataMap[d].locked);
-            const voteCounts = dates.map(d => dataMap[d].votes);
-            
-            const totalLocks = lockCounts.reduce((a, b) => a + b, 0);
-            const totalVotes = voteCounts.reduce((a, b) => a + b, 0);
-            
-            const trace1 = {{
-                x: dates, y: lockCounts, name: 'Lock Txs', type: 'bar', marker: {{color: '#90caf9'}},
-                text: lockCounts.map(v => v > 0 ? v : ""), textposition: 'auto'
-            }};
-            const trace2 = {{
-                x: dates, y: voteCounts, name: 'Vote Txs', type: 'bar', marker: {{color: '#a5d6a7'}},
-                text: voteCounts.map(v => v > 0 ? v : ""), textposition: 'auto'
-            }};
-            
-             const layout = {{
-                title: {{
-                    text: 'Daily Transaction Counts',
-                    y: 0.98,
-                    yanchor: 'top'
-                }},
-                barmode: 'group',
-                margin: {{t: 120, l: 50, r: 50, b: 50}},
-                legend: {{orientation: 'h', y: 1.3}},
-                hovermode: 'x unified',
-                autosize: true,
-                xaxis: {{ 
-                    type: 'date',
-                    tickformat: '%b %d',
-                    automargin: true,
-                    showline: true,
-                    linewidth: 1,
-                    linecolor: '#888',
-                    ticks: 'outside'
-                }},
-                yaxis: {{
-                    title: 'Transaction Count',
-                    rangemode: 'tozero',
-                    zeroline: false,
-                    showline: true,
-                    linewidth: 1,
-                    linecolor: '#ddd'
-                }}
-            }};
-            
-            Plotly.newPlot('countChart', [trace1, trace2], layout, {{responsive: true}});
-        }}
-
-        function renderDistribution(locks) {{
-            // bucket stats
-            const buckets = {{}};
-            catOrder.forEach(c => buckets[c] = {{count:0, vol:0}});
-            
-            locks.forEach(l => {{
-                if (buckets[l.cat]) {{
-                    buckets[l.cat].count++;
-                    buckets[l.cat].vol += l.amount;
-                }}
-            }});
-            
-            // Update Table
-            const tbody = document.querySelector("#distTable tbody");
-            tbody.innerHTML = "";
-            
-            const pieLabels = [];
-            const pieVolValues = [];
-            const pieCountValues = [];
-            const pieColors = [];
-            
-            catOrder.forEach(cat => {{
-                const b = buckets[cat];
-                const color = colors[cat];
-                const isHidden = hiddenCategories.has(cat);
-                
-                // Table Row
-                const tr = document.createElement("tr");
-                tr.style.opacity = isHidden ? 0.5 : 1;
-                tr.onclick = () => toggleCategory(cat);
-                
-                tr.innerHTML = `
-                    <td><span class="legend-color" style="background:${{color}}"></span>${{cat}}</td>
-                    <td class="mono">${{b.count}}</td>
-                    <td class="mono">${{b.vol.toFixed(2)}}</td>
-                `;
-                tbody.appendChild(tr);
-                
-                // Pie Data
-                if (!isHidden) {{ // Include 0 counts? Usually no.
-                     if (b.count > 0 || b.vol > 0) {{
-                        pieLabels.push(cat);
-                        pieVolValues.push(b.vol);
-                        pieCountValues.push(b.count);
-                        pieColors.push(colors[cat]);
-                     }}
-                }}
-            }});
-            
-            // Common Pie Layout
-            const layout = {{
-                margin: {{t: 10, l: 0, r: 0, b: 10}},
-                showlegend: false,
-                autosize: true
-            }};
-            
-            // Render Pie Vol
-            const traceVol = {{
-                labels: pieLabels, values: pieVolValues, type: 'pie',
-                marker: {{colors: pieColors}},
-                textinfo: 'percent', hoverinfo: 'label+value+percent', name: 'Volume'
-            }};
-            Plotly.newPlot('pieChart', [traceVol], layout, {{responsive: true}});
-            
-            // Render Pie Count
-            const traceCount = {{
-                labels: pieLabels, values: pieCountValues, type: 'pie',
-                marker: {{colors: pieColors}},
-                textinfo: 'percent', hoverinfo: 'label+value+percent', name: 'Count'
-            }};
-            Plotly.newPlot('pieChartCount', [traceCount], layout, {{responsive: true}});
-        }}
-        
-        function toggleCategory(cat) {{
-            if (hiddenCategories.has(cat)) hiddenCategories.delete(cat);
-            else hiddenCategories.add(cat);
-            updateDashboard();
-        }}
-
-        function renderTables(locks, votes) {{
-            // Lock Table (All)
-            const lockBody = document.querySelector("#lockTable tbody");
-            lockBody.innerHTML = "";
-            
-            // sort desc
-            const sortedLocks = [...locks].sort((a,b) => new Date(b.date) - new Date(a.date));
-            
-            sortedLocks.forEach(l => {{
-                const tr = document.createElement("tr");
-                tr.innerHTML = `<td>${{l.ts.replace('T', ' ')}}</td><td class="mono">${{l.sender}}</td><td class="mono">${{l.amount.toFixed(4)}}</td><td>${{l.cat}}</td>`;
-                lockBody.appendChild(tr);
-            }});
-            
-            // Vote Table
-            const voteBody = document.querySelector("#voteTable tbody");
-            voteBody.innerHTML = "";
-            const sortedVotes = [...votes].sort((a,b) => new Date(b.date) - new Date(a.date));
-            
-             sortedVotes.forEach(v => {{
-                const tr = document.createElement("tr");
-                tr.innerHTML = `<td>${{v.ts.replace('T', ' ')}}</td><td class="mono">${{v.voter}}</td><td class="mono">${{v.voting_power.toFixed(4)}}</td><td class="mono">${{v.total_weight.toFixed(2)}}</td>`;
-                voteBody.appendChild(tr);
-            }});
-        }}
-
-    </script>
-</body>
-</html>
-    """
-    
-    with open("index.html", "w") as f:
-        f.write(html_content)
-        print("Dashboard saved as index.html")
+    def compressed_embed(obj: Any) -> bytes:
+        # gzip + base64 shrinks the repetitive JSON ~5-10x; the browser's
+        # native DecompressionStream inflates it client-side at load
+        return base64.b64encode(gzip.compress(orjson.dumps(obj, default=json_serial)))
+
+    # Data lives in a sidecar script so the (large) payload never has to be
+    # concatenated into the HTML string, and browsers can cache it separately
+    with open(DATA_JS_FILE, "wb") as f:
+        f.write(b'window.rawLocksB64 = "')
+        f.write(compressed_embed(locks))
+        f.write(b'";\nwindow.rawVotesB64 = "')
+        f.write(compressed_embed(votes))
+        f.write(b'";\nwindow.dailyStats = ')
+        f.write(orjson.dumps(daily_stats, default=json_serial))
+        f.write(b";\nwindow.dailyDist = ")
+        f.write(orjson.dumps(daily_dist, default=json_serial))
+        f.write(b";\n")
+
+    # The HTML template lives in dashboard.j2; Jinja compiles it once and
+    # stream().dump() writes rendered blocks straight to disk instead of
+    # building the whole page as one in-memory string first
+    env = Environment(loader=FileSystemLoader(os.path.dirname(os.path.abspath(__file__))))
+    env.get_template(TEMPLATE_FILE).stream(
+        data_js_file=DATA_JS_FILE,
+        generated_at=datetime.now().strftime("%Y-%m-%d %H:%M"),
+        current_balance=current_balance,
+        total_voted=total_voted,
+    ).dump("index.html")
+    print("Dashboard saved as index.html")
 
 if __name__ == "__main__":
     # 1. Load old
     existing_locks, existing_votes = load_data()
     
     # 2. Fetch new
-    new_locks = fetch_incremental(LOCK_URL, {"filter": "to", "token": LOCK_TOKEN}, existing_locks, "locks")
-    new_votes = fetch_incremental(VOTE_URL, {}, existing_votes, "votes")
-    
-    # 3. Balance
-    current_balance = fetch_current_balance()
+    existing_ids = load_uid_index(len(existing_locks) + len(existing_votes))
+    uid_index_missed = existing_ids is None
+    if existing_ids is None and (existing_locks or existing_votes):
+        lock_uid = _uid_builder("locks")
+        vote_uid = _uid_builder("votes")
+        existing_ids = frozenset(
+            [lock_uid(i) for i in existing_locks] + [vote_uid(i) for i in existing_votes]
+        )
+
+    # Locks, votes and balance live on independent endpoints, so all three
+    # round-trips run concurrently on one shared session: total network time
+    # is the slowest fetch, not the sum
+    async def _fetch_all():
+        async with _make_client_session() as session:
+            return await asyncio.gather(
+                fetch_incremental(LOCK_URL, {"filter": "to", "token": LOCK_TOKEN}, existing_locks, "locks", existing_ids, session),
+                fetch_incremental(VOTE_URL, {}, existing_votes, "votes", existing_ids, session),
+                fetch_current_balance(session),
+            )
+
+    new_locks, new_votes, current_balance = asyncio.run(_fetch_all())
 
     # 4. Merge (New + Old)
     all_locks = new_locks + existing_locks
     all_votes = new_votes + existing_votes
     
     # 5. Save & Gen
-    if new_locks or new_votes:
-        save_data(all_locks, all_votes)
-        
+    # The (large) JSON write is pure I/O: run it on a worker thread so it
+    # overlaps with the CPU-bound parse and dashboard build below
+    save_executor = ThreadPoolExecutor(max_workers=1)
+    save_future = save_executor.submit(save_data, all_locks, all_votes) if (new_locks or new_votes) else None
+    if save_future is None and uid_index_missed:
+        # Nothing new to save, but the uid index was absent or stale: rewrite
+        # it so the file always exists after a run and the next one can skip
+        # the in-memory rebuild
+        _write_uid_index(all_locks, all_votes)
+
     df_main, dist_df, raw_locks_df, raw_votes_df = parse_data(all_locks, all_votes)
     
-    # Convert DFs to lists for JSON serialization
-    locks_list = raw_locks_df.to_dict('records')
-    votes_list = raw_votes_df.to_dict('records')
-    
+    # Numeric timestamps: the JS sorts on integer seconds instead of parsing
+    # a Date object per comparison
+    if not raw_locks_df.empty:
+        raw_locks_df["ts"] = raw_locks_df["ts"].astype("datetime64[s]").astype("int64")
+    if not raw_votes_df.empty:
+        raw_votes_df["ts"] = raw_votes_df["ts"].astype("datetime64[s]").astype("int64")
+
+    # Display strings are formatted once here, vectorized; the JS table rows
+    # interpolate them directly instead of calling toFixed per rendered row
+    if not raw_locks_df.empty:
+        raw_locks_df["amount_fmt"] = raw_locks_df["amount"].map("{:.4f}".format)
+    if not raw_votes_df.empty:
+        raw_votes_df["voting_power_fmt"] = raw_votes_df["voting_power"].map("{:.4f}".format)
+        raw_votes_df["total_weight_fmt"] = raw_votes_df["total_weight"].map("{:.2f}".format)
+
+    # Columnar layout for the JS payload: one key per column instead of one
+    # per row, restricted to the columns the page actually reads. Per-column
+    # .tolist() is one C-level conversion each - no per-row dicts
+    lock_columns = ["date", "ts", "amount", "amount_fmt", "sender", "cat"]
+    vote_columns = ["date", "ts", "voter", "voting_power", "voting_power_fmt", "total_weight", "total_weight_fmt"]
+    locks_payload = {col: raw_locks_df[col].tolist() for col in lock_columns if col in raw_locks_df.columns}
+    votes_payload = {col: raw_votes_df[col].tolist() for col in vote_columns if col in raw_votes_df.columns}
+
     # 6. Calculate Totals
     # A. Total Voted: sum of latest totalWeight for each unique pool (gauge)
     latest_gauge_tw = {}
-    for v in reversed(votes_list):
-        pool = v.get('pool')
-        if pool and pool != "Unknown":
-            latest_gauge_tw[pool] = v.get('total_weight', 0)
-            
+    if not raw_votes_df.empty:
+        # Rows are ts-descending; walk oldest-first so the newest weight wins
+        for pool, tw in zip(reversed(raw_votes_df["pool"].tolist()), reversed(raw_votes_df["total_weight"].tolist())):
+            if pool and pool != "Unknown":
+                latest_gauge_tw[pool] = tw
+
+
     total_voted_val = sum(latest_gauge_tw.values())
     total_voted_str = f"{total_voted_val:,.2f}"
     
@@ -967,4 +658,36 @@ if __name__ == "__main__":
     total_supply_val = total_voted_val + UNVOTED_DELTA
     total_supply_str = f"{total_supply_val:,.6f}"
 
-    generate_dashboard(locks_list, votes_list, current_balance, total_voted_str, total_supply_str)
\ No newline at end of file
+    # Per-(date, category) lock aggregates: the distribution view sums
+    # #days x #buckets rows for the selected range instead of every lock
+    if not raw_locks_df.empty:
+        daily_dist_df = (
+            raw_locks_df.groupby(["date", "cat"], observed=True)
+            .agg(count=("amount", "size"), vol=("amount", "sum"))
+            .reset_index()
+        )
+        daily_dist = {col: daily_dist_df[col].tolist() for col in ["date", "cat", "count", "vol"]}
+    else:
+        daily_dist = {}
+
+    # C. Per-day aggregates (amounts, counts, cumulative) for the JS charts
+    daily_stats = [
+        {
+            "date": str(row.date),
+            "lock_amount": row.amount,
+            "lock_count": int(row.lock_count),
+            "vote_power": row.voting_power,
+            "vote_count": int(row.vote_count),
+            "cum_lock": row.cumulative_locks,
+            "cum_vote": row.cumulative_votes,
+        }
+        for row in df_main.itertuples()
+    ]
+
+    generate_dashboard(locks_payload, votes_payload, current_balance, total_voted_str, total_supply_str, daily_stats, daily_dist)
+
+    # Don't exit before the background save has landed (and surface its
+    # exception here if it failed)
+    if save_future is not None:
+        save_future.result()
+    save_executor.shutdown()
\ No newline at end of file